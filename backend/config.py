@@ -21,6 +21,10 @@ class Settings:
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./data/insights.db")
     
+    # Job status store (in-memory when REDIS_URL is empty)
+    REDIS_URL: str = os.getenv("REDIS_URL", "")
+    JOB_TTL_SECONDS: int = int(os.getenv("JOB_TTL_SECONDS", "86400"))
+    
     # Folders - use absolute paths
     UPLOAD_FOLDER: str = os.getenv("UPLOAD_FOLDER", str(BASE_DIR / "uploads"))
     OUTPUT_FOLDER: str = os.getenv("OUTPUT_FOLDER", str(BASE_DIR / "reports"))
@@ -28,6 +32,14 @@ class Settings:
     # Server
     HOST: str = os.getenv("HOST", "0.0.0.0")
     PORT: int = int(os.getenv("PORT", "8000"))
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
+    
+    # Executors: threads for blocking I/O, processes for CPU-bound rendering
+    IO_THREADS: int = int(os.getenv("IO_THREADS", "8"))
+    CPU_WORKERS: int = int(os.getenv("CPU_WORKERS", str(min(4, os.cpu_count() or 1))))
+    
+    # Upper bound on parsed DataFrames kept in memory for reuse between preview and analysis
+    FRAME_CACHE_MB: int = int(os.getenv("FRAME_CACHE_MB", "256"))
 
 
 settings = Settings()
@@ -8,20 +8,27 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
 import os
 import uuid
+import logging
 import asyncio
+import shutil
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
-from services.data_processor import DataProcessor
-from services.insight_generator import insight_generator
-from services.report_generator import ReportGenerator
 from config import settings
-# In main.py - only the import section
+
+logging.basicConfig(
+    level=settings.LOG_LEVEL,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+logger = logging.getLogger(__name__)
+
 from services.data_processor import DataProcessor
-from services.insight_generator import insight_generator  # Import the instance, not the class
+from services.insight_generator import insight_generator
 from services.report_generator import ReportGenerator
-from config import settings
+from services.job_store import JobStore
 
 # Initialize services
 data_processor = DataProcessor()
@@ -46,13 +53,27 @@ app.add_middleware(
 os.makedirs(settings.UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(settings.OUTPUT_FOLDER, exist_ok=True)
 
-# Initialize services
-data_processor = DataProcessor()
-# insight_generator is already imported as an instance from the module
-report_generator = ReportGenerator()
+# Job status storage: Redis when REDIS_URL is set (shared by all workers), else in-memory
+jobs = JobStore(redis_url=settings.REDIS_URL, ttl_seconds=settings.JOB_TTL_SECONDS)
+
+# Upload file_id -> extension, recorded at upload time so lookups don't probe
+# every extension on disk. Misses (restart, other worker) fall back to probing.
+FILE_INDEX = {}
+ALLOWED_EXTENSIONS = ['.csv', '.xlsx', '.xls', '.json', '.sql']
 
-# In-memory job storage (use Redis/DB in production)
-jobs = {}
+# Chart and report rendering are CPU heavy; run them in worker processes so
+# concurrent jobs don't block the event loop. "spawn" avoids forking live threads.
+# The default executor (asyncio.to_thread) handles blocking I/O, plus file parsing:
+# that is CPU-bound too, but it must run in this process to use DataProcessor's
+# frame cache (a preview's parse is reused by the analysis) and to avoid pickling
+# the DataFrame back from a worker.
+_CPU_POOL = ProcessPoolExecutor(
+    max_workers=settings.CPU_WORKERS,
+    mp_context=multiprocessing.get_context("spawn")
+)
+
+# Uploads are streamed to disk in chunks of this size so memory stays flat
+UPLOAD_CHUNK_SIZE = 1 << 16
 
 
 class JobStatus(BaseModel):
@@ -73,6 +94,18 @@ class ReportConfig(BaseModel):
     include_recommendations: bool = True
 
 
+@app.on_event("startup")
+async def configure_executors():
+    # Bound the default thread pool so I/O offloads don't oversubscribe the CPU
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=settings.IO_THREADS))
+
+
+@app.on_event("shutdown")
+async def shutdown_executors():
+    _CPU_POOL.shutdown(wait=False, cancel_futures=True)
+
+
 @app.get("/")
 async def root():
     return {"message": "Automated Insight Engine API", "status": "running"}
@@ -83,38 +116,92 @@ async def health_check():
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
 
+def _resolve_upload(file_id: str, extensions: List[str] = ALLOWED_EXTENSIONS) -> Optional[str]:
+    """Return the stored path for an uploaded file_id, or None if unknown"""
+    ext = FILE_INDEX.get(file_id)
+    if ext is not None:
+        if ext not in extensions:
+            return None
+        return os.path.join(settings.UPLOAD_FOLDER, f"{file_id}{ext}")
+    
+    for ext in extensions:
+        path = os.path.join(settings.UPLOAD_FOLDER, f"{file_id}{ext}")
+        if os.path.exists(path):
+            FILE_INDEX[file_id] = ext
+            return path
+    return None
+
+
+def _copy_upload(source, file_path: str):
+    """Blocking chunked copy of a spooled upload onto disk"""
+    with open(file_path, "wb") as out:
+        shutil.copyfileobj(source, out, UPLOAD_CHUNK_SIZE)
+
+
+def _remove_upload(file_path: str):
+    """Delete a stored upload, ignoring files that were never created"""
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        pass
+
+
+async def _save_upload(file: UploadFile, file_ext: str) -> dict:
+    """Stream a single validated upload into the upload folder"""
+    file_id = str(uuid.uuid4())
+    file_path = os.path.join(settings.UPLOAD_FOLDER, f"{file_id}{file_ext}")
+    
+    try:
+        # One executor hop per file instead of one per chunk
+        await asyncio.to_thread(_copy_upload, file.file, file_path)
+    except Exception:
+        await asyncio.to_thread(_remove_upload, file_path)
+        raise
+    finally:
+        await file.close()
+    
+    FILE_INDEX[file_id] = file_ext
+    
+    return {
+        "file_id": file_id,
+        "original_name": file.filename,
+        "file_path": file_path,
+        "file_type": file_ext
+    }
+
+
 @app.post("/api/upload")
 async def upload_files(files: List[UploadFile] = File(...)):
     """Upload one or more data files (CSV, Excel, JSON)"""
-    uploaded_files = []
-    
-    for file in files:
-        # Validate file type
-        allowed_extensions = ['.csv', '.xlsx', '.xls', '.json', '.sql']
-        file_ext = os.path.splitext(file.filename)[1].lower()
-        
-        if file_ext not in allowed_extensions:
+    # Validate every file type before writing anything, so a rejected request leaves no files behind
+    extensions = [os.path.splitext(f.filename)[1].lower() for f in files]
+    for file_ext in extensions:
+        if file_ext not in ALLOWED_EXTENSIONS:
+            for f in files:
+                await f.close()
             raise HTTPException(
                 status_code=400, 
-                detail=f"File type {file_ext} not supported. Allowed: {allowed_extensions}"
+                detail=f"File type {file_ext} not supported. Allowed: {ALLOWED_EXTENSIONS}"
             )
+    
+    results = await asyncio.gather(
+        *(_save_upload(f, ext) for f, ext in zip(files, extensions)),
+        return_exceptions=True
+    )
+    
+    failures = [r for r in results if isinstance(r, Exception)]
+    if failures:
+        # The client never sees the ids of the files that did save; remove them
+        for result in results:
+            if not isinstance(result, Exception):
+                FILE_INDEX.pop(result["file_id"], None)
+                await asyncio.to_thread(_remove_upload, result["file_path"])
         
-        # Save file
-        file_id = str(uuid.uuid4())
-        file_path = os.path.join(settings.UPLOAD_FOLDER, f"{file_id}{file_ext}")
-        
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
-        
-        uploaded_files.append({
-            "file_id": file_id,
-            "original_name": file.filename,
-            "file_path": file_path,
-            "file_type": file_ext
-        })
+        if isinstance(failures[0], HTTPException):
+            raise failures[0]
+        raise HTTPException(status_code=400, detail=f"Upload failed: {failures[0]}")
     
-    return {"uploaded_files": uploaded_files, "count": len(uploaded_files)}
+    return {"uploaded_files": results, "count": len(results)}
 
 
 @app.post("/api/analyze")
@@ -125,12 +212,12 @@ async def analyze_data(
     """Start analysis job for uploaded files"""
     job_id = str(uuid.uuid4())
     
-    jobs[job_id] = JobStatus(
+    await jobs.create(job_id, JobStatus(
         job_id=job_id,
         status="pending",
         progress=0,
         message="Job queued for processing"
-    )
+    ).model_dump())
     
     # Start background processing using asyncio.create_task
     asyncio.create_task(
@@ -148,81 +235,105 @@ async def process_analysis_job(job_id: str, file_ids: List[str], config: ReportC
     """Background task to process data and generate report"""
     try:
         # Update status
-        jobs[job_id].status = "processing"
-        jobs[job_id].progress = 10
-        jobs[job_id].message = "Loading data files..."
+        await jobs.update(
+            job_id,
+            status="processing",
+            progress=10,
+            message="Loading data files..."
+        )
         
         # Find uploaded files
         file_paths = []
         for fid in file_ids:
-            for ext in ['.csv', '.xlsx', '.xls', '.json', '.sql']:
-                path = os.path.join(settings.UPLOAD_FOLDER, f"{fid}{ext}")
-                print(f"Checking path: {path}")
-                if os.path.exists(path):
-                    file_paths.append(path)
-                    print(f"Found file: {path}")
-                    break
+            path = _resolve_upload(fid)
+            if path:
+                file_paths.append(path)
+                logger.debug("Found file: %s", path)
         
         if not file_paths:
             raise Exception(f"No valid files found for IDs: {file_ids}")
         
-        print(f"Processing files: {file_paths}")
+        logger.debug("Processing files: %s", file_paths)
         
         # Process data
-        jobs[job_id].progress = 25
-        jobs[job_id].message = "Processing and transforming data..."
+        await jobs.update(
+            job_id,
+            progress=25,
+            message="Processing and transforming data..."
+        )
         
-        processed_data = data_processor.process_files(file_paths)
-        print(f"Data processed: {processed_data['metadata'].get('total_rows', 0)} rows")
+        # Parsing runs in a thread, not _CPU_POOL, so the processor's frame cache is shared
+        processed_data = await asyncio.to_thread(data_processor.process_files, file_paths)
+        logger.debug("Data processed: %s rows", processed_data['metadata'].get('total_rows', 0))
         
         # Generate AI insights
-        jobs[job_id].progress = 50
-        jobs[job_id].message = "Generating AI-powered insights..."
+        await jobs.update(
+            job_id,
+            progress=50,
+            message="Generating AI-powered insights..."
+        )
         
         insights = await insight_generator.generate_insights(processed_data)
-        print("Insights generated")
+        logger.debug("Insights generated")
         
         # Generate charts
-        jobs[job_id].progress = 70
-        jobs[job_id].message = "Creating visualizations..."
+        await jobs.update(
+            job_id,
+            progress=70,
+            message="Creating visualizations..."
+        )
         
-        charts = data_processor.generate_charts(processed_data)
-        print(f"Charts generated: {list(charts.keys())}")
+        charts = await data_processor.generate_charts_async(
+            processed_data, executor=_CPU_POOL, job_id=job_id
+        )
+        logger.debug("Charts generated: %s", list(charts))
         
         # Generate report
-        jobs[job_id].progress = 85
-        jobs[job_id].message = f"Generating {config.report_type.upper()} report..."
+        await jobs.update(
+            job_id,
+            progress=85,
+            message=f"Generating {config.report_type.upper()} report..."
+        )
         
-        report_path = report_generator.generate_report(
+        report_path = await report_generator.generate_report_async(
             data=processed_data,
             insights=insights,
             charts=charts,
             config=config.model_dump(),
-            job_id=job_id
+            job_id=job_id,
+            executor=_CPU_POOL
         )
-        print(f"Report generated: {report_path}")
+        logger.info("Report generated: %s", report_path)
         
         # Complete
-        jobs[job_id].status = "completed"
-        jobs[job_id].progress = 100
-        jobs[job_id].message = "Report generated successfully!"
-        jobs[job_id].report_url = f"/api/reports/{job_id}/{config.report_type}"
-        jobs[job_id].insights = insights
+        await jobs.update(
+            job_id,
+            status="completed",
+            progress=100,
+            message="Report generated successfully!",
+            report_url=f"/api/reports/{job_id}/{config.report_type}",
+            insights=insights
+        )
         
     except Exception as e:
-        import traceback
-        print(f"Error in job {job_id}: {str(e)}")
-        traceback.print_exc()
-        jobs[job_id].status = "failed"
-        jobs[job_id].message = f"Error: {str(e)}"
+        logger.exception("Error in job %s", job_id)
+        await jobs.update(
+            job_id,
+            status="failed",
+            message=f"Error: {str(e)}"
+        )
+    finally:
+        # Charts are embedded in the report; the per-job images aren't needed afterwards
+        await asyncio.to_thread(data_processor.remove_charts, job_id)
 
 
 @app.get("/api/jobs/{job_id}")
 async def get_job_status(job_id: str):
     """Get the status of an analysis job"""
-    if job_id not in jobs:
+    job = await jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    return jobs[job_id]
+    return JobStatus(**job)
 
 
 @app.get("/api/reports/{job_id}/{report_type}")
@@ -250,15 +361,13 @@ async def preview_data(file_ids: List[str]):
     previews = []
     
     for fid in file_ids:
-        for ext in ['.csv', '.xlsx', '.xls', '.json']:
-            path = os.path.join(settings.UPLOAD_FOLDER, f"{fid}{ext}")
-            if os.path.exists(path):
-                preview = data_processor.get_preview(path)
-                previews.append({
-                    "file_id": fid,
-                    "preview": preview
-                })
-                break
+        path = _resolve_upload(fid, ['.csv', '.xlsx', '.xls', '.json'])
+        if path:
+            preview = data_processor.get_preview(path)
+            previews.append({
+                "file_id": fid,
+                "preview": preview
+            })
     
     return {"previews": previews}
 
@@ -6,20 +6,231 @@ Handles ingestion and transformation of data from various sources
 import pandas as pd
 import json
 import os
-from typing import List, Dict, Any, Union
-import matplotlib.pyplot as plt
+import shutil
+import asyncio
+import tempfile
+import threading
+import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Union
+import matplotlib
+matplotlib.use('Agg')  # headless rendering straight to PNG
+from matplotlib.figure import Figure
 import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta
-import random
+from collections import OrderedDict
+import logging
+
+logger = logging.getLogger(__name__)
+
+# PyArrow parses CSV in multithreaded C++; fall back to pandas when missing
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+    import pyarrow.feather as feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    pv = None
+    feather = None
+    PYARROW_AVAILABLE = False
+
+def _group_columns_by_dtype(df: pd.DataFrame) -> Tuple[List[str], List[str], List[str]]:
+    """Split columns into (numeric, datetime, categorical) in one pass over the dtypes"""
+    numeric_cols, date_cols, categorical_cols = [], [], []
+    for col, dtype in df.dtypes.items():
+        kind = dtype.kind
+        if kind in 'iufc':
+            numeric_cols.append(col)
+        elif kind == 'M':
+            date_cols.append(col)
+        elif kind == 'O':  # object, category and string dtypes
+            categorical_cols.append(col)
+    return numeric_cols, date_cols, categorical_cols
+
+
+# Categorical columns with more distinct values than this get no value counts
+MAX_CATEGORIES = 100_000
+
+
+def _save_figure(fig: Figure, chart_path: str) -> None:
+    """Write a Matplotlib figure to PNG"""
+    # Figures are built with the object-oriented API, never registered with pyplot,
+    # so charts can render concurrently on threads and need no plt.close()
+    fig.savefig(chart_path, dpi=100, bbox_inches='tight')
+
+
+def _chart_metrics(df: pd.DataFrame, metadata: Dict[str, Any], output_dir: str) -> Optional[Tuple[str, str]]:
+    """Summary statistics bar chart"""
+    numeric_cols = metadata.get("numeric_columns", [])
+    if not numeric_cols:
+        return None
+    
+    stats_df = df[numeric_cols[:5]].describe().loc[['mean', 'std', 'min', 'max']]
+    
+    fig = Figure(figsize=(8, 5))
+    ax = fig.subplots()
+    x = np.arange(len(stats_df.index))
+    width = 0.8 / len(stats_df.columns)
+    for i, col in enumerate(stats_df.columns):
+        ax.bar(x - 0.4 + width * (i + 0.5), stats_df[col], width, label=col)
+    
+    ax.set_xticks(x)
+    ax.set_xticklabels(stats_df.index)
+    ax.set_title("Key Metrics Overview")
+    ax.legend()
+    chart_path = os.path.join(output_dir, "metrics_overview.png")
+    _save_figure(fig, chart_path)
+    return "metrics_overview", chart_path
+
+
+def _chart_distribution(df: pd.DataFrame, metadata: Dict[str, Any], output_dir: str) -> Optional[Tuple[str, str]]:
+    """Distribution plots for numeric columns"""
+    numeric_cols = metadata.get("numeric_columns", [])
+    if len(numeric_cols) < 1:
+        return None
+    
+    fig = Figure(figsize=(9, 6))
+    axes = fig.subplots(
+        nrows=min(2, len(numeric_cols)),
+        ncols=min(2, len(numeric_cols)),
+        squeeze=False
+    )
+    axes = axes.ravel()
+    
+    for ax, col in zip(axes, numeric_cols[:4]):
+        values = df[col].to_numpy(dtype=np.float32, na_value=np.nan)
+        ax.hist(values[~np.isnan(values)], bins=30)
+        ax.set_title(col)
+    for ax in axes[len(numeric_cols[:4]):]:
+        ax.set_visible(False)
+    
+    fig.suptitle("Data Distribution Analysis")
+    fig.tight_layout()
+    chart_path = os.path.join(output_dir, "distribution.png")
+    _save_figure(fig, chart_path)
+    return "distribution", chart_path
+
+
+def _chart_correlation(df: pd.DataFrame, metadata: Dict[str, Any], output_dir: str) -> Optional[Tuple[str, str]]:
+    """Correlation heatmap"""
+    numeric_cols = metadata.get("numeric_columns", [])
+    if len(numeric_cols) < 2:
+        return None
+    
+    corr_matrix = df[numeric_cols[:8]].corr()
+    
+    fig = Figure(figsize=(7, 6))
+    ax = fig.subplots()
+    heatmap = ax.imshow(corr_matrix.values, cmap='RdBu', vmin=-1, vmax=1)
+    ticks = np.arange(len(corr_matrix.columns))
+    ax.set_xticks(ticks)
+    ax.set_xticklabels(corr_matrix.columns, rotation=45, ha='right')
+    ax.set_yticks(ticks)
+    ax.set_yticklabels(corr_matrix.columns)
+    fig.colorbar(heatmap, ax=ax)
+    
+    ax.set_title("Correlation Matrix")
+    chart_path = os.path.join(output_dir, "correlation.png")
+    _save_figure(fig, chart_path)
+    return "correlation", chart_path
+
+
+def _chart_category(df: pd.DataFrame, metadata: Dict[str, Any], output_dir: str) -> Optional[Tuple[str, str]]:
+    """Category breakdown (pie/bar chart)"""
+    categorical_cols = metadata.get("categorical_columns", [])
+    if not categorical_cols:
+        return None
+    
+    cat_col = categorical_cols[0]
+    value_counts = df[cat_col].value_counts().head(10)
+    
+    fig = Figure(figsize=(7, 5))
+    ax = fig.subplots()
+    ax.pie(
+        value_counts.values,
+        labels=[str(label) for label in value_counts.index],
+        autopct='%1.1f%%',
+        wedgeprops={"width": 0.6}
+    )
+    
+    ax.set_title(f"Distribution by {cat_col}")
+    chart_path = os.path.join(output_dir, "category_breakdown.png")
+    _save_figure(fig, chart_path)
+    return "category_breakdown", chart_path
+
+
+def _chart_trend(df: pd.DataFrame, metadata: Dict[str, Any], output_dir: str) -> Optional[Tuple[str, str]]:
+    """Trend analysis (if date column exists)"""
+    numeric_cols = metadata.get("numeric_columns", [])
+    date_cols = metadata.get("date_columns", [])
+    if len(date_cols) == 0 or len(numeric_cols) == 0:
+        return None
+    
+    date_col = date_cols[0]
+    metric_col = numeric_cols[0]
+    
+    df_sorted = df.sort_values(date_col)
+    
+    fig = Figure(figsize=(9, 5))
+    ax = fig.subplots()
+    ax.plot(df_sorted[date_col], df_sorted[metric_col], marker='o', markersize=3, label=metric_col)
+    
+    ax.set_title(f"Trend Analysis: {metric_col} over Time")
+    ax.set_xlabel("Date")
+    ax.set_ylabel(metric_col)
+    fig.autofmt_xdate()
+    chart_path = os.path.join(output_dir, "trend_analysis.png")
+    _save_figure(fig, chart_path)
+    return "trend_analysis", chart_path
+
+
+# Independent chart renderers; each returns (name, path) or None when not applicable
+CHART_FUNCTIONS = [_chart_metrics, _chart_distribution, _chart_correlation, _chart_category, _chart_trend]
+
+
+def _share_chart_frame(df: pd.DataFrame, metadata: Dict[str, Any]) -> Optional[str]:
+    """Write the columns the charts read to an uncompressed Feather file in shared memory.
+    Returns the path, or None if PyArrow is unavailable or the frame can't be written."""
+    if not PYARROW_AVAILABLE:
+        return None
+    
+    numeric_cols = metadata.get("numeric_columns", [])[:8]
+    categorical_cols = metadata.get("categorical_columns", [])[:1]
+    date_cols = metadata.get("date_columns", [])[:1]
+    columns = list(dict.fromkeys(numeric_cols + categorical_cols + date_cols))
+    
+    shm_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    fd, path = tempfile.mkstemp(suffix=".feather", dir=shm_dir)
+    os.close(fd)
+    try:
+        feather.write_feather(df[columns].reset_index(drop=True), path, compression='uncompressed')
+    except Exception as e:
+        logger.warning("Falling back to pickling chart data: %s", e)
+        os.unlink(path)
+        return None
+    return path
+
+
+def _render_chart(chart_fn, df_ref: Union[pd.DataFrame, str], metadata: Dict[str, Any], output_dir: str):
+    """Executor entry point: memory-map a shared Feather file if given a path, then render"""
+    if isinstance(df_ref, str):
+        df_ref = feather.read_table(df_ref, memory_map=True).to_pandas()
+    return chart_fn(df_ref, metadata, output_dir)
 
 
 class DataProcessor:
     def __init__(self):
         self.supported_formats = ['.csv', '.xlsx', '.xls', '.json', '.sql']
+        # Parsed files keyed by (path, mtime, size) so preview and analysis share one parse.
+        # Values are (frame, bytes); bounded by count and total size, and shared across threads
+        from config import settings
+        self._frame_cache: "OrderedDict[tuple, Tuple[pd.DataFrame, int]]" = OrderedDict()
+        self._frame_cache_size = 8
+        self._frame_cache_max_bytes = settings.FRAME_CACHE_MB * 1024 * 1024
+        self._frame_cache_bytes = 0
+        self._frame_cache_lock = threading.Lock()
         
     def process_files(self, file_paths: List[str]) -> Dict[str, Any]:
         """Process multiple files and combine data"""
@@ -42,8 +253,11 @@ class DataProcessor:
         if not all_data:
             raise ValueError("No data could be loaded from the provided files")
         
-        # Combine all dataframes
-        combined_df = pd.concat(all_data, ignore_index=True) if len(all_data) > 1 else all_data[0]
+        # Combine all dataframes (a single file is used as-is, no copy or reindex)
+        if len(all_data) == 1:
+            combined_df = all_data[0]
+        else:
+            combined_df = pd.concat(all_data, ignore_index=True, copy=False)
         
         # Generate metadata
         metadata["total_rows"] = len(combined_df)
@@ -52,20 +266,19 @@ class DataProcessor:
         metadata["data_types"] = {col: str(dtype) for col, dtype in combined_df.dtypes.items()}
         
         # Calculate statistics for numeric columns
-        numeric_cols = combined_df.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            metadata["column_stats"][col] = {
-                "mean": float(combined_df[col].mean()) if not pd.isna(combined_df[col].mean()) else 0,
-                "median": float(combined_df[col].median()) if not pd.isna(combined_df[col].median()) else 0,
-                "std": float(combined_df[col].std()) if not pd.isna(combined_df[col].std()) else 0,
-                "min": float(combined_df[col].min()) if not pd.isna(combined_df[col].min()) else 0,
-                "max": float(combined_df[col].max()) if not pd.isna(combined_df[col].max()) else 0,
-                "sum": float(combined_df[col].sum()) if not pd.isna(combined_df[col].sum()) else 0
-            }
+        numeric_cols, date_cols, categorical_cols = _group_columns_by_dtype(combined_df)
+        if numeric_cols:
+            stats = (
+                combined_df[numeric_cols]
+                .agg(['mean', 'median', 'std', 'min', 'max', 'sum'])
+                .fillna(0.0)
+                .astype(float)
+            )
+            for col in stats.columns:
+                metadata["column_stats"][col] = stats[col].to_dict()
         
         # Try to find date columns
-        date_cols = combined_df.select_dtypes(include=['datetime64']).columns
-        if len(date_cols) > 0:
+        if date_cols:
             date_col = date_cols[0]
             metadata["date_range"] = {
                 "start": str(combined_df[date_col].min()),
@@ -73,28 +286,74 @@ class DataProcessor:
             }
         
         # Identify categorical columns
-        categorical_cols = combined_df.select_dtypes(include=['object', 'category']).columns
-        metadata["categorical_columns"] = list(categorical_cols)
-        metadata["numeric_columns"] = list(numeric_cols)
+        metadata["categorical_columns"] = categorical_cols
+        metadata["numeric_columns"] = numeric_cols
+        metadata["date_columns"] = date_cols
         
         # Value counts for categorical columns (top 10)
         for col in categorical_cols[:5]:  # Limit to first 5 categorical columns
-            value_counts = combined_df[col].value_counts().head(10).to_dict()
+            counts = combined_df[col].value_counts(sort=True)
+            if len(counts) > MAX_CATEGORIES:
+                continue  # IDs/URLs: too many distinct values to be a useful breakdown
+            value_counts = counts.head(10).to_dict()
             metadata["column_stats"][col] = {"value_counts": {str(k): int(v) for k, v in value_counts.items()}}
         
         return {
             "dataframe": combined_df,
-            "metadata": metadata,
-            "summary": combined_df.describe().to_dict()
+            "metadata": metadata
         }
     
     def _load_file(self, file_path: str) -> Union[pd.DataFrame, None]:
-        """Load a single file into a pandas DataFrame"""
+        """Load a single file into a pandas DataFrame, reusing a cached parse if unchanged"""
+        try:
+            stat = os.stat(file_path)
+        except OSError as e:
+            logger.error("Error loading %s: %s", file_path, e)
+            return None
+        
+        key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        with self._frame_cache_lock:
+            entry = self._frame_cache.get(key)
+            if entry is not None:
+                self._frame_cache.move_to_end(key)
+        
+        if entry is None:
+            # Parse outside the lock; two threads may parse the same file, the last one is cached
+            df = self._parse_file(file_path)
+            if df is None:
+                return None
+            self._cache_frame(key, df)
+        else:
+            df = entry[0]
+        
+        # Shallow copy so callers can't swap columns out of the cached frame
+        return df.copy(deep=False)
+    
+    def _cache_frame(self, key: tuple, df: pd.DataFrame) -> None:
+        """Insert a parsed frame, evicting least recently used entries past the count or byte limit"""
+        # deep=True counts the string payloads of object columns, not just their pointers
+        size = int(df.memory_usage(deep=True).sum())
+        if size > self._frame_cache_max_bytes:
+            return  # would evict everything else and still not fit
+        
+        with self._frame_cache_lock:
+            previous = self._frame_cache.pop(key, None)
+            if previous is not None:
+                self._frame_cache_bytes -= previous[1]
+            self._frame_cache[key] = (df, size)
+            self._frame_cache_bytes += size
+            while (len(self._frame_cache) > self._frame_cache_size
+                   or self._frame_cache_bytes > self._frame_cache_max_bytes):
+                _, (_, evicted_size) = self._frame_cache.popitem(last=False)
+                self._frame_cache_bytes -= evicted_size
+    
+    def _parse_file(self, file_path: str) -> Union[pd.DataFrame, None]:
+        """Parse a single file into a pandas DataFrame"""
         ext = os.path.splitext(file_path)[1].lower()
         
         try:
             if ext == '.csv':
-                df = pd.read_csv(file_path)
+                df = self._read_csv(file_path)
             elif ext in ['.xlsx', '.xls']:
                 df = pd.read_excel(file_path)
             elif ext == '.json':
@@ -102,19 +361,50 @@ class DataProcessor:
             else:
                 return None
             
-            # Try to parse date columns
-            for col in df.columns:
-                if 'date' in col.lower() or 'time' in col.lower():
-                    try:
-                        df[col] = pd.to_datetime(df[col])
-                    except:
-                        pass
+            # Parse date-like columns; keep the original if any value fails to parse
+            candidates = [
+                col for col in df.columns
+                if ('date' in str(col).lower() or 'time' in str(col).lower())
+                and df[col].dtype == object
+            ]
+            for col in candidates:
+                expected = df[col].notna().sum()
+                # ISO strings take the fast path; other layouts (e.g. 01/15/2024) fall back to inference
+                parsed = pd.to_datetime(df[col], errors='coerce', format='ISO8601', cache=True)
+                if parsed.notna().sum() != expected:
+                    with warnings.catch_warnings():
+                        # Per-element dateutil parsing is the intended fallback here
+                        warnings.simplefilter("ignore", UserWarning)
+                        parsed = pd.to_datetime(df[col], errors='coerce', cache=True)
+                if parsed.notna().sum() == expected:
+                    df[col] = parsed
             
             return df
         except Exception as e:
-            print(f"Error loading {file_path}: {e}")
+            logger.error("Error loading %s: %s", file_path, e)
             return None
     
+    def _read_csv(self, file_path: str) -> pd.DataFrame:
+        """Read a CSV with PyArrow when available, otherwise with pandas"""
+        if PYARROW_AVAILABLE:
+            try:
+                table = pv.read_csv(
+                    file_path,
+                    read_options=pv.ReadOptions(block_size=1 << 20),
+                    convert_options=pv.ConvertOptions(strings_can_be_null=True)
+                )
+            except pa.ArrowInvalid:
+                # Arrow is stricter about ragged rows and mixed-type columns
+                table = None
+            # pandas dedupes repeated headers (a, a.1) and rejects non-UTF-8 text that
+            # Arrow would load as binary; let it handle those files as before
+            if (table is not None
+                    and len(set(table.column_names)) == table.num_columns
+                    and not any(pa.types.is_binary(field.type) or pa.types.is_large_binary(field.type)
+                                for field in table.schema)):
+                return table.to_pandas(split_blocks=True, self_destruct=True, date_as_object=False)
+        return pd.read_csv(file_path)
+    
     def get_preview(self, file_path: str, rows: int = 10) -> Dict[str, Any]:
         """Get a preview of the data file"""
         df = self._load_file(file_path)
@@ -129,188 +419,128 @@ class DataProcessor:
             "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()}
         }
     
-    def generate_charts(self, processed_data: Dict[str, Any]) -> Dict[str, str]:
+    def _chart_output_dir(self, job_id: Optional[str] = None, create: bool = True) -> str:
+        # Use absolute path for charts directory; one subdirectory per job so
+        # concurrent jobs never overwrite each other's images
+        from config import settings
+        output_dir = os.path.join(settings.OUTPUT_FOLDER, "charts")
+        if job_id:
+            output_dir = os.path.join(output_dir, job_id)
+        if create:
+            os.makedirs(output_dir, exist_ok=True)
+        return output_dir
+    
+    def remove_charts(self, job_id: str) -> None:
+        """Delete a job's chart directory once its report has been written"""
+        shutil.rmtree(self._chart_output_dir(job_id, create=False), ignore_errors=True)
+    
+    def generate_charts(self, processed_data: Dict[str, Any], job_id: Optional[str] = None) -> Dict[str, str]:
         """Generate various charts from the processed data"""
         df = processed_data["dataframe"]
         metadata = processed_data["metadata"]
+        output_dir = self._chart_output_dir(job_id)
         charts = {}
         
-        # Use absolute path for charts directory
-        from config import settings
-        output_dir = os.path.join(settings.OUTPUT_FOLDER, "charts")
-        os.makedirs(output_dir, exist_ok=True)
-        
-        numeric_cols = metadata.get("numeric_columns", [])
-        categorical_cols = metadata.get("categorical_columns", [])
-        
-        # 1. Summary statistics bar chart
-        if numeric_cols:
+        for chart_fn in CHART_FUNCTIONS:
             try:
-                fig = make_subplots(rows=1, cols=1)
-                stats_df = df[numeric_cols[:5]].describe().loc[['mean', 'std', 'min', 'max']]
-                
-                fig = go.Figure()
-                for col in stats_df.columns:
-                    fig.add_trace(go.Bar(name=col, x=stats_df.index, y=stats_df[col]))
-                
-                fig.update_layout(
-                    title="Key Metrics Overview",
-                    barmode='group',
-                    template="plotly_white"
-                )
-                chart_path = os.path.join(output_dir, "metrics_overview.png")
-                fig.write_image(chart_path, width=800, height=500)
-                charts["metrics_overview"] = chart_path
+                result = chart_fn(df, metadata, output_dir)
             except Exception as e:
-                print(f"Error generating metrics chart: {e}")
+                logger.error("Error generating chart %s: %s", chart_fn.__name__, e)
+                continue
+            if result is not None:
+                name, path = result
+                charts[name] = path
         
-        # 2. Distribution plots for numeric columns
-        if len(numeric_cols) >= 1:
-            try:
-                fig = make_subplots(
-                    rows=min(2, len(numeric_cols)), 
-                    cols=min(2, len(numeric_cols)),
-                    subplot_titles=numeric_cols[:4]
-                )
-                
-                for i, col in enumerate(numeric_cols[:4]):
-                    row = i // 2 + 1
-                    col_idx = i % 2 + 1
-                    fig.add_trace(
-                        go.Histogram(x=df[col], name=col, nbinsx=30),
-                        row=row, col=col_idx
-                    )
-                
-                fig.update_layout(
-                    title="Data Distribution Analysis",
-                    showlegend=False,
-                    template="plotly_white",
-                    height=600
-                )
-                chart_path = os.path.join(output_dir, "distribution.png")
-                fig.write_image(chart_path, width=900, height=600)
-                charts["distribution"] = chart_path
-            except Exception as e:
-                print(f"Error generating distribution chart: {e}")
+        return charts
+    
+    async def generate_charts_async(
+        self,
+        processed_data: Dict[str, Any],
+        executor: Optional[Executor] = None,
+        job_id: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Render all charts concurrently on `executor` (default loop executor if None)"""
+        df = processed_data["dataframe"]
+        metadata = processed_data["metadata"]
+        output_dir = self._chart_output_dir(job_id)
         
-        # 3. Correlation heatmap
-        if len(numeric_cols) >= 2:
-            try:
-                corr_matrix = df[numeric_cols[:8]].corr()
-                
-                fig = go.Figure(data=go.Heatmap(
-                    z=corr_matrix.values,
-                    x=corr_matrix.columns,
-                    y=corr_matrix.columns,
-                    colorscale='RdBu',
-                    zmid=0
-                ))
-                
-                fig.update_layout(
-                    title="Correlation Matrix",
-                    template="plotly_white"
-                )
-                chart_path = os.path.join(output_dir, "correlation.png")
-                fig.write_image(chart_path, width=700, height=600)
-                charts["correlation"] = chart_path
-            except Exception as e:
-                print(f"Error generating correlation chart: {e}")
+        # Crossing into worker processes: hand over a shared Feather file, not a pickle per chart
+        frame_path = None
+        if isinstance(executor, ProcessPoolExecutor):
+            frame_path = _share_chart_frame(df, metadata)
+        df_ref = frame_path or df
         
-        # 4. Category breakdown (pie/bar chart)
-        if categorical_cols:
-            try:
-                cat_col = categorical_cols[0]
-                value_counts = df[cat_col].value_counts().head(10)
-                
-                fig = go.Figure(data=[go.Pie(
-                    labels=value_counts.index,
-                    values=value_counts.values,
-                    hole=0.4
-                )])
-                
-                fig.update_layout(
-                    title=f"Distribution by {cat_col}",
-                    template="plotly_white"
-                )
-                chart_path = os.path.join(output_dir, "category_breakdown.png")
-                fig.write_image(chart_path, width=700, height=500)
-                charts["category_breakdown"] = chart_path
-            except Exception as e:
-                print(f"Error generating category chart: {e}")
+        try:
+            loop = asyncio.get_running_loop()
+            results = await asyncio.gather(
+                *(loop.run_in_executor(executor, _render_chart, chart_fn, df_ref, metadata, output_dir)
+                  for chart_fn in CHART_FUNCTIONS),
+                return_exceptions=True
+            )
+        finally:
+            if frame_path:
+                os.unlink(frame_path)
         
-        # 5. Trend analysis (if date column exists)
-        date_cols = df.select_dtypes(include=['datetime64']).columns
-        if len(date_cols) > 0 and len(numeric_cols) > 0:
-            try:
-                date_col = date_cols[0]
-                metric_col = numeric_cols[0]
-                
-                df_sorted = df.sort_values(date_col)
-                
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=df_sorted[date_col],
-                    y=df_sorted[metric_col],
-                    mode='lines+markers',
-                    name=metric_col
-                ))
-                
-                fig.update_layout(
-                    title=f"Trend Analysis: {metric_col} over Time",
-                    xaxis_title="Date",
-                    yaxis_title=metric_col,
-                    template="plotly_white"
-                )
-                chart_path = os.path.join(output_dir, "trend_analysis.png")
-                fig.write_image(chart_path, width=900, height=500)
-                charts["trend_analysis"] = chart_path
-            except Exception as e:
-                print(f"Error generating trend chart: {e}")
+        charts = {}
+        for chart_fn, result in zip(CHART_FUNCTIONS, results):
+            if isinstance(result, Exception):
+                logger.error("Error generating chart %s: %s", chart_fn.__name__, result)
+            elif result is not None:
+                name, path = result
+                charts[name] = path
         
         return charts
     
     def generate_sample_data(self) -> str:
         """Generate sample AdTech data for demonstration"""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         
         # Generate dates for the last 30 days
         dates = pd.date_range(end=datetime.now(), periods=30, freq='D')
         
         # Campaign data
-        campaigns = ['Brand Awareness', 'Lead Generation', 'Retargeting', 'Product Launch', 'Holiday Sale']
-        channels = ['Google Ads', 'Facebook', 'Instagram', 'LinkedIn', 'TikTok', 'Twitter']
-        regions = ['North America', 'Europe', 'Asia Pacific', 'Latin America']
+        campaigns = np.array(['Brand Awareness', 'Lead Generation', 'Retargeting', 'Product Launch', 'Holiday Sale'])
+        channels = np.array(['Google Ads', 'Facebook', 'Instagram', 'LinkedIn', 'TikTok', 'Twitter'])
+        regions = np.array(['North America', 'Europe', 'Asia Pacific', 'Latin America'])
+        
+        # Each (date, campaign) pair runs on 2-4 distinct channels
+        groups = len(dates) * len(campaigns)
+        per_group = rng.integers(2, 5, groups)
+        shuffled = rng.permuted(np.tile(np.arange(len(channels)), (groups, 1)), axis=1)
+        picked = shuffled[np.arange(len(channels)) < per_group[:, None]]
+        n = len(picked)
         
-        data = []
-        for date in dates:
-            for campaign in campaigns:
-                for channel in random.sample(channels, random.randint(2, 4)):
-                    impressions = random.randint(10000, 500000)
-                    clicks = int(impressions * random.uniform(0.01, 0.05))
-                    conversions = int(clicks * random.uniform(0.02, 0.15))
-                    spend = round(random.uniform(100, 5000), 2)
-                    revenue = round(conversions * random.uniform(20, 200), 2)
-                    
-                    data.append({
-                        'Date': date,
-                        'Campaign': campaign,
-                        'Channel': channel,
-                        'Region': random.choice(regions),
-                        'Impressions': impressions,
-                        'Clicks': clicks,
-                        'Conversions': conversions,
-                        'Spend': spend,
-                        'Revenue': revenue,
-                        'CTR': round(clicks / impressions * 100, 2),
-                        'CPC': round(spend / clicks, 2) if clicks > 0 else 0,
-                        'ROAS': round(revenue / spend, 2) if spend > 0 else 0
-                    })
+        impressions = rng.integers(10000, 500001, n)
+        clicks = (impressions * rng.uniform(0.01, 0.05, n)).astype(np.int64)
+        conversions = (clicks * rng.uniform(0.02, 0.15, n)).astype(np.int64)
+        spend = np.round(rng.uniform(100, 5000, n), 2)
+        revenue = np.round(conversions * rng.uniform(20, 200, n), 2)
         
-        df = pd.DataFrame(data)
+        df = pd.DataFrame({
+            'Date': np.repeat(np.repeat(dates, len(campaigns)), per_group),
+            'Campaign': np.repeat(np.tile(campaigns, len(dates)), per_group),
+            'Channel': channels[picked],
+            'Region': rng.choice(regions, n),
+            'Impressions': impressions,
+            'Clicks': clicks,
+            'Conversions': conversions,
+            'Spend': spend,
+            'Revenue': revenue,
+            'CTR': np.round(clicks / impressions * 100, 2),
+            'CPC': np.round(np.divide(spend, clicks, out=np.zeros(n), where=clicks > 0), 2),
+            'ROAS': np.round(revenue / spend, 2)
+        })
         
         # Save to uploads folder
         os.makedirs("./uploads", exist_ok=True)
         sample_path = "./uploads/sample_adtech_data.csv"
-        df.to_csv(sample_path, index=False)
+        if PYARROW_AVAILABLE:
+            pv.write_csv(
+                pa.Table.from_pandas(df, preserve_index=False),
+                sample_path,
+                write_options=pv.WriteOptions(batch_size=65536)
+            )
+        else:
+            df.to_csv(sample_path, index=False)
         
         return sample_path
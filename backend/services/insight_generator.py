@@ -8,41 +8,94 @@ If Gemini is unavailable or the key is missing, it returns a canned fallback.
 
 import os
 import asyncio
-from typing import Any, Dict
+import functools
+import hashlib
+import importlib.util
+import itertools
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Union
 
-# Import Gemini SDK
+logger = logging.getLogger(__name__)
+
+# The Gemini SDK is heavy to import; only check it is installed here and load it on first use
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except Exception:
-    genai = None
+    GEMINI_AVAILABLE = importlib.util.find_spec("google.generativeai") is not None
+except ImportError:
     GEMINI_AVAILABLE = False
 
+# orjson parses the batched JSON replies faster; fall back to the stdlib parser
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Read key from env
 GEMINI_KEY = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
 MODEL_NAME = "gemini-1.5-flash"  # fast model; change if you prefer another
+EMPTY: Dict[str, Any] = {}  # shared read-only default; never mutate
+INSIGHT_CACHE_SIZE = 256  # recent Gemini answers kept, keyed by summary hash
+
+GEMINI_CONFIGURED = bool(GEMINI_KEY and GEMINI_AVAILABLE)
+if not GEMINI_KEY:
+    logger.warning("GOOGLE_API_KEY / GEMINI_API_KEY not set; InsightGenerator will use fallback text.")
+if not GEMINI_AVAILABLE:
+    logger.warning("google.generativeai library not available; install via `pip install google-generativeai`")
+
+
+@functools.lru_cache(maxsize=None)
+def _genai():
+    """Import and configure google.generativeai on first use"""
+    import google.generativeai as genai
+    genai.configure(api_key=GEMINI_KEY)
+    logger.info("Gemini API configured successfully")
+    return genai
+
+
+# What each analysis should contain and how it is laid out; kept terse since
+# every prompt token adds latency
+RESPONSE_FORMAT = (
+    "**Insights:**\n1.-3. short\n"
+    "**Recommendations:**\n1.-2. short\n"
+    "**Executive Summary:**\n1 sentence.\n"
+)
+
+# Instruction preamble for the insight prompt; the data summary is appended per call
+PROMPT_PREAMBLE = "Data analyst. Produce:\n" + RESPONSE_FORMAT + "Data:\n"
 
-if GEMINI_KEY and GEMINI_AVAILABLE:
-    try:
-        genai.configure(api_key=GEMINI_KEY)
-        GEMINI_CONFIGURED = True
-        print("Gemini API configured successfully")
-    except Exception as e:
-        print("Warning: failed to configure google.generativeai:", e)
-        GEMINI_CONFIGURED = False
-else:
-    GEMINI_CONFIGURED = False
-    if not GEMINI_KEY:
-        print("Warning: GOOGLE_API_KEY / GEMINI_API_KEY not set; InsightGenerator will use fallback text.")
-    if not GEMINI_AVAILABLE:
-        print("Warning: google.generativeai library not available; install via `pip install google-generativeai`")
+# Preamble for a coalesced request covering several summaries at once
+BATCH_PROMPT_PREAMBLE = (
+    "Data analyst. For each '### REQUEST <n> ###' block below, using only its data, produce:\n"
+    + RESPONSE_FORMAT
+    + "Return a JSON array of strings, one complete response per request, in request order.\n\n"
+)
+
+# Three insights, two recommendations and a sentence fit well within this
+MAX_OUTPUT_TOKENS = 256
+TEMPERATURE = 0.4
+# Longer summaries are cut; prompt length dominates time to first token
+MAX_SUMMARY_CHARS = 1500
+
+# Concurrent requests arriving within this window are sent as one Gemini call
+BATCH_WINDOW_SECONDS = 0.05
+BATCH_MAX_SIZE = 8
 
 
 class InsightGenerator:
     def __init__(self):
         self.model = MODEL_NAME
         self.gemini_available = GEMINI_CONFIGURED
-        print(f"InsightGenerator initialized. Gemini available: {self.gemini_available}")
+        # One model object (and its client) reused across calls, created on the first call
+        self._model_obj = None
+        # summary hash -> Gemini text; the summary is a deterministic function of the data
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        # Coalescing queue of (summary, future); worker is started lazily on the running loop
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_worker: Optional[asyncio.Task] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+        logger.info("InsightGenerator initialized. Gemini available: %s", self.gemini_available)
 
     async def generate_insights(self, processed_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -50,94 +103,166 @@ class InsightGenerator:
         Returns a dict (so main.py can store `insights` as dict).
         If Gemini call fails, returns a demo fallback dict.
         """
-        print(f"Generating insights for data with {processed_data.get('metadata', {}).get('total_rows', 0)} rows")
+        logger.debug("Generating insights for data with %s rows", processed_data.get('metadata', {}).get('total_rows', 0))
+        
+        # Without Gemini there is no prompt to build
+        if not self.gemini_available:
+            logger.debug("Gemini not available. Key: %s, SDK: %s", bool(GEMINI_KEY), GEMINI_AVAILABLE)
+            return {"text": self._canned_fallback(processed_data), "source": "fallback"}
         
         # Build a textual summary from processed_data for LLM
         # Keep it concise to reduce latency
-        summary = self._build_summary(processed_data)
+        summary = self._build_summary(processed_data)[:MAX_SUMMARY_CHARS]
         
-        print(f"Built summary of {len(summary)} characters")
+        logger.debug("Built summary of %d characters", len(summary))
 
-        # If Gemini is configured and SDK available, call it in a thread to avoid blocking the event loop
-        if self.gemini_available and GEMINI_KEY and genai:
-            try:
-                print("Attempting to call Gemini API...")
-                # Use asyncio.to_thread to run blocking network call off the event loop
-                raw_text = await asyncio.to_thread(self._call_gemini, summary)
-                print("Gemini API call successful")
-                return {"text": raw_text, "source": "gemini"}
-            except Exception as e:
-                print(f"Gemini API error: {str(e)}")
-                print("Falling back to canned insights...")
-                # fall through to fallback
-        else:
-            print(f"Gemini not available. Available: {self.gemini_available}, Key: {bool(GEMINI_KEY)}, SDK: {bool(genai)}")
+        # Serve repeats from the cache, otherwise call Gemini's async API on the event loop
+        key = hashlib.blake2b(summary.encode(), digest_size=16).hexdigest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return {"text": cached, "source": "gemini-cache"}
+        
+        try:
+            logger.debug("Attempting to call Gemini API...")
+            raw_text = await self._submit_for_batch(summary)
+            logger.debug("Gemini API call successful")
+            self._cache[key] = raw_text
+            if len(self._cache) > INSIGHT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+            return {"text": raw_text, "source": "gemini"}
+        except Exception as e:
+            logger.warning("Gemini API error, falling back to canned insights: %s", e)
+            # fall through to fallback
         
         # Fallback canned insights
         fallback = self._canned_fallback(processed_data)
         return {"text": fallback, "source": "fallback"}
 
-    def _call_gemini(self, prompt_text: str) -> str:
+    async def _call_gemini_async(self, prompt_text: str) -> str:
         """
-        Blocking call to Gemini SDK. Kept in sync function and run via to_thread.
-        Uses a straightforward text generation call and returns a single string.
+        Native async call to the Gemini SDK; runs on the event loop without a worker thread.
+        Returns the response text as a single string.
         """
-        try:
-            # Compose an instruction prompt: ask for short insights + recommendations + summary
-            prompt = f"""
-You are an expert data analyst. Given the following concise data summary, produce:
-1) Three short business insights (one-line each).
-2) Two practical recommendations.
-3) A one-sentence executive summary.
-
-Format the response as:
-**Insights:**
-1. [Insight 1]
-2. [Insight 2]
-3. [Insight 3]
-
-**Recommendations:**
-1. [Recommendation 1]
-2. [Recommendation 2]
-
-**Executive Summary:**
-[One sentence summary]
-
-Data summary:
-{prompt_text}
-"""
-            
-            # Try the newer generate_content API which is more reliable
-            model = genai.GenerativeModel(self.model)
-            response = model.generate_content(prompt, generation_config={"max_output_tokens": 512})
-            
-            # Extract text from response
-            if hasattr(response, "text"):
-                return response.text.strip()
-            elif hasattr(response, "candidates") and response.candidates:
-                first_candidate = response.candidates[0]
-                if hasattr(first_candidate, "content"):
-                    if hasattr(first_candidate.content, "parts"):
-                        parts = first_candidate.content.parts
-                        return " ".join([part.text for part in parts if hasattr(part, "text")]).strip()
-                    elif hasattr(first_candidate.content, "text"):
-                        return first_candidate.content.text.strip()
-            
-            # Fallback to string representation
-            return str(response).strip()
+        # Static instructions are built once at import; only the data tail varies
+        prompt = PROMPT_PREAMBLE + prompt_text + "\n"
+        
+        response = await self._model().generate_content_async(
+            prompt,
+            generation_config={"max_output_tokens": MAX_OUTPUT_TOKENS, "temperature": TEMPERATURE}
+        )
+        return self._extract_text(response)
+
+    async def generate_insights_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate insights for several processed datasets at once.
+        Submitted together, they are coalesced into ceil(len(items) / BATCH_MAX_SIZE) Gemini calls.
+        Results are returned in the same order as `items`.
+        """
+        return list(await asyncio.gather(*(self.generate_insights(item) for item in items)))
+
+    async def _submit_for_batch(self, summary: str) -> str:
+        """Queue a summary for the coalescing worker and wait for its answer"""
+        loop = asyncio.get_running_loop()
+        worker = self._batch_worker
+        if worker is None or worker.done() or worker.get_loop() is not loop:
+            self._batch_queue = asyncio.Queue()
+            self._batch_worker = loop.create_task(self._batch_loop(self._batch_queue))
+        
+        future = loop.create_future()
+        await self._batch_queue.put((summary, future))
+        return await future
+
+    async def _batch_loop(self, queue: asyncio.Queue) -> None:
+        """Collect requests arriving within a short window and dispatch them together"""
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(BATCH_WINDOW_SECONDS)
+            while len(batch) < BATCH_MAX_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
             
+            task = asyncio.create_task(self._dispatch_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _dispatch_batch(self, batch: List[tuple]) -> None:
+        summaries = [summary for summary, _ in batch]
+        try:
+            if len(summaries) == 1:
+                results = [await self._call_gemini_async(summaries[0])]
+            else:
+                results = await self._call_gemini_batched(summaries)
         except Exception as e:
-            print(f"Error in _call_gemini: {str(e)}")
-            # Try alternate approach if the first fails
+            results = [e] * len(batch)
+        
+        for (_, future), result in zip(batch, results):
+            if future.done():  # caller went away
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _call_gemini_batched(self, summaries: List[str]) -> List[Union[str, Exception]]:
+        """One Gemini call for several summaries; falls back to per-summary calls if
+        the batched call fails (quota, safety block, prompt too large) or its reply can't be split"""
+        prompt = BATCH_PROMPT_PREAMBLE + "\n\n".join(
+            f"### REQUEST {i} ###\n{summary}" for i, summary in enumerate(summaries, 1)
+        )
+        try:
+            response = await self._model().generate_content_async(
+                prompt,
+                generation_config={
+                    "max_output_tokens": MAX_OUTPUT_TOKENS * len(summaries),
+                    "temperature": TEMPERATURE,
+                    "response_mime_type": "application/json"
+                }
+            )
+        except Exception as e:
+            logger.warning("Batched Gemini call failed (%s); retrying %d requests individually", e, len(summaries))
+            response = None
+        
+        if response is not None:
             try:
-                # Try the simpler API
-                response = genai.generate_text(model=self.model, prompt=prompt_text[:500], max_output_tokens=512)
-                if hasattr(response, "text"):
-                    return response.text.strip()
-                return str(response).strip()
-            except Exception as e2:
-                print(f"Alternate Gemini call also failed: {str(e2)}")
-                raise
+                answers = _json_loads(self._extract_text(response))
+            except ValueError:
+                answers = None
+            if (isinstance(answers, list) and len(answers) == len(summaries)
+                    and all(isinstance(answer, str) for answer in answers)):
+                return [answer.strip() for answer in answers]
+            
+            logger.warning("Could not split batched Gemini response; retrying %d requests individually", len(summaries))
+        
+        return await asyncio.gather(
+            *(self._call_gemini_async(summary) for summary in summaries),
+            return_exceptions=True
+        )
+
+    def _model(self):
+        """Return the shared GenerativeModel, importing the SDK on first use"""
+        if self._model_obj is None:
+            self._model_obj = _genai().GenerativeModel(MODEL_NAME)
+        return self._model_obj
+
+    @staticmethod
+    def _extract_text(response: Any) -> str:
+        """Pull the generated text out of a Gemini response object"""
+        try:
+            return response.text.strip()
+        except (AttributeError, ValueError):
+            # `.text` raises ValueError when the candidate has no simple text part
+            pass
+        
+        candidates = getattr(response, "candidates", None)
+        if candidates:
+            content = getattr(candidates[0], "content", None)
+            if hasattr(content, "parts"):
+                return " ".join([part.text for part in content.parts if hasattr(part, "text")]).strip()
+            elif hasattr(content, "text"):
+                return content.text.strip()
+        
+        # Fallback to string representation
+        return str(response).strip()
 
     def _build_summary(self, processed_data: Dict[str, Any]) -> str:
         """
@@ -145,48 +270,59 @@ Data summary:
         Try to include: total rows, columns, top numeric columns and example aggregates.
         This function should be adapted to the shape of your DataProcessor output.
         """
-        meta = processed_data.get("metadata", {})
+        meta = processed_data.get("metadata") or EMPTY
         total_rows = meta.get("total_rows", "unknown")
-        columns = meta.get("columns", [])
-        numeric_stats = meta.get("numeric_stats", {})  # optional
+        columns = meta.get("columns") or ()
+        # DataProcessor keeps per-column stats in column_stats; categorical entries only hold value counts
+        column_stats = meta.get("column_stats") or EMPTY
+        numeric_stats = {
+            col: column_stats[col]
+            for col in itertools.islice(meta.get("numeric_columns") or (), 5)
+            if col in column_stats
+        }
         top_cols = ", ".join(columns[:6]) if columns else "N/A"
         
-        # Build concise numeric summary if available
-        num_summary_lines = []
-        if isinstance(numeric_stats, dict) and numeric_stats:
-            for col, stats in list(numeric_stats.items())[:5]:
-                # stats expected like {'mean':..., 'min':..., 'max':...}
-                mean = stats.get("mean", "N/A")
-                md = f"{col}: mean={mean}, min={stats.get('min','N/A')}, max={stats.get('max','N/A')}"
-                num_summary_lines.append(md)
-
-        summary = (
-            f"Dataset Summary:\n"
+        parts = [
+            "Dataset Summary:\n"
             f"- Total rows: {total_rows}\n"
             f"- Number of columns: {len(columns)}\n"
             f"- Column names (sample): {top_cols}\n"
-        )
+        ]
         
-        if num_summary_lines:
-            summary += "\nNumeric column statistics:\n" + "\n".join(num_summary_lines) + "\n"
+        # Build concise numeric summary if available
+        num_summary = self._format_numeric_stats(numeric_stats)
+        if num_summary:
+            parts.append(f"\nNumeric column statistics:\n{num_summary}\n")
         
         # Check for categorical columns
-        categorical_cols = meta.get("categorical_columns", [])
+        categorical_cols = meta.get("categorical_columns")
         if categorical_cols:
-            summary += f"\nCategorical columns: {', '.join(categorical_cols[:5])}\n"
+            parts.append(f"\nCategorical columns: {', '.join(categorical_cols[:5])}\n")
         
         # If processed_data contains a short preview, include first 200-800 chars
         preview = processed_data.get("preview_text") or processed_data.get("sample_text")
         if preview:
             # truncate to keep prompt short
-            truncated_preview = preview[:600] + ("..." if len(preview) > 600 else "")
-            summary += f"\nData preview:\n{truncated_preview}\n"
+            truncated_preview = (preview[:597] + "...") if len(preview) > 600 else preview
+            parts.append(f"\nData preview:\n{truncated_preview}\n")
         
         # Add any other relevant metadata
-        if meta.get("missing_values"):
-            summary += f"\nMissing values detected in: {meta.get('missing_values')}\n"
+        missing_values = meta.get("missing_values")
+        if missing_values:
+            parts.append(f"\nMissing values detected in: {missing_values}\n")
         
-        return summary
+        return "".join(parts)
+
+    @staticmethod
+    def _format_numeric_stats(numeric_stats: Dict[str, Dict[str, Any]]) -> str:
+        """Format up to five columns as 'col: mean=..., min=..., max=...' lines"""
+        def fmt(value: Any) -> Any:
+            return round(value, 3) if isinstance(value, float) else value
+        
+        return "\n".join(
+            f"{col}: mean={fmt(stats.get('mean', 'N/A'))}, min={fmt(stats.get('min', 'N/A'))}, max={fmt(stats.get('max', 'N/A'))}"
+            for col, stats in itertools.islice(numeric_stats.items(), 5)
+        )
 
     def _canned_fallback(self, processed_data: Dict[str, Any]) -> str:
         """Return a demo insights string when the LLM is unavailable."""
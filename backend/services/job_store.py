@@ -0,0 +1,104 @@
+"""
+Job Store Service
+Keeps analysis job status in Redis (shared across workers) or in process memory
+"""
+
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Redis is optional; without it jobs live in this process only
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    REDIS_AVAILABLE = False
+
+# Update fields and refresh the TTL only if the job still exists, so a late
+# update can't recreate an expired job as a partial hash.
+# KEYS[1] = job key, ARGV = [ttl, field1, value1, field2, value2, ...]
+_UPDATE_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+
+class JobStore:
+    def __init__(self, redis_url: str = "", ttl_seconds: int = 86400):
+        self.ttl_seconds = ttl_seconds
+        self._redis = None
+        # job_id -> (expires_at, fields) when running without Redis
+        self._jobs: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+        if redis_url and REDIS_AVAILABLE:
+            self._redis = aioredis.Redis.from_url(redis_url)
+            self._update_script = self._redis.register_script(_UPDATE_IF_EXISTS)
+        elif redis_url:
+            logger.warning("REDIS_URL is set but the redis library is not installed; using in-memory job store")
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"job:{job_id}"
+
+    async def create(self, job_id: str, fields: Dict[str, Any]) -> None:
+        """Store a new job, replacing any previous job with the same id"""
+        if self._redis is None:
+            self._purge_expired()
+            self._jobs[job_id] = (time.monotonic() + self.ttl_seconds, dict(fields))
+            return
+
+        key = self._key(job_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping={k: json.dumps(v) for k, v in fields.items()})
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+
+    async def update(self, job_id: str, **fields: Any) -> None:
+        """Update selected fields of an existing job and refresh its TTL; unknown or expired jobs are ignored"""
+        if not fields:
+            return
+        if self._redis is None:
+            entry = self._jobs.get(job_id)
+            now = time.monotonic()
+            if entry is None or entry[0] < now:
+                return
+            entry[1].update(fields)
+            self._jobs[job_id] = (now + self.ttl_seconds, entry[1])
+            return
+
+        args: List[Any] = [self.ttl_seconds]
+        for k, v in fields.items():
+            args.extend((k, json.dumps(v)))
+        await self._update_script(keys=[self._key(job_id)], args=args)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the job's fields, or None if it is unknown or expired"""
+        if self._redis is None:
+            entry = self._jobs.get(job_id)
+            if entry is None:
+                return None
+            expires_at, fields = entry
+            if expires_at < time.monotonic():
+                self._jobs.pop(job_id, None)
+                return None
+            return dict(fields)
+
+        raw = await self._redis.hgetall(self._key(job_id))
+        if not raw:
+            return None
+        return {k.decode(): json.loads(v) for k, v in raw.items()}
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        expired = [job_id for job_id, (expires_at, _) in self._jobs.items() if expires_at < now]
+        for job_id in expired:
+            del self._jobs[job_id]
@@ -3,33 +3,135 @@ Report Generator Service
 Creates PDF and PowerPoint reports from data and insights
 """
 
+import io
 import os
-from typing import Dict, Any, List
+import asyncio
+import functools
+from copy import deepcopy
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Any, List, Optional
 from datetime import datetime
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle, PageBreak
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from types import SimpleNamespace
+from xml.sax.saxutils import escape
+import aiofiles
 from config import settings
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _pdf_mod() -> SimpleNamespace:
+    """Import reportlab on first use, so processes that never build a PDF don't load it"""
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle, PageBreak
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT
+    from reportlab.pdfbase import pdfmetrics
+    
+    # Load the AFM metrics for the fonts used by the report styles once per process,
+    # so each doc.build() doesn't pay for it
+    for font_name in ("Helvetica", "Helvetica-Bold"):
+        pdfmetrics.getFont(font_name)
+    
+    return SimpleNamespace(
+        colors=colors,
+        letter=letter,
+        getSampleStyleSheet=getSampleStyleSheet,
+        ParagraphStyle=ParagraphStyle,
+        inch=inch,
+        SimpleDocTemplate=SimpleDocTemplate,
+        Paragraph=Paragraph,
+        Spacer=Spacer,
+        Image=Image,
+        Table=Table,
+        TableStyle=TableStyle,
+        PageBreak=PageBreak,
+        TA_CENTER=TA_CENTER,
+        TA_LEFT=TA_LEFT,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _pptx_mod() -> SimpleNamespace:
+    """Import python-pptx on first use, along with the deck's shared measurements and colors"""
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+    from pptx.dml.color import RGBColor
+    from pptx.enum.text import PP_ALIGN
+    
+    clr_body = RGBColor(31, 41, 55)
+    return SimpleNamespace(
+        Presentation=Presentation,
+        PP_ALIGN=PP_ALIGN,
+        # Measurements and colors, built once instead of per shape/paragraph
+        INCH_04=Inches(0.4),
+        INCH_05=Inches(0.5),
+        INCH_075=Inches(0.75),
+        INCH_08=Inches(0.8),
+        INCH_1=Inches(1),
+        INCH_15=Inches(1.5),
+        INCH_175=Inches(1.75),
+        INCH_25=Inches(2.5),
+        INCH_3=Inches(3),
+        INCH_4=Inches(4),
+        INCH_45=Inches(4.5),
+        INCH_5=Inches(5),
+        INCH_525=Inches(5.25),
+        INCH_55=Inches(5.5),
+        INCH_75=Inches(7.5),
+        INCH_10333=Inches(10.333),
+        INCH_11833=Inches(11.833),
+        INCH_12333=Inches(12.333),
+        INCH_13333=Inches(13.333),
+        PT_10=Pt(10),
+        PT_12=Pt(12),
+        PT_14=Pt(14),
+        PT_15=Pt(15),
+        PT_16=Pt(16),
+        PT_18=Pt(18),
+        PT_24=Pt(24),
+        PT_32=Pt(32),
+        PT_44=Pt(44),
+        CLR_TITLE=RGBColor(37, 99, 235),
+        CLR_ACCENT=RGBColor(59, 130, 246),
+        CLR_BODY=clr_body,
+        CLR_GRAY=RGBColor(107, 114, 128),
+        # Bullet paragraph templates by (font size, space before) in points
+        BULLET_16_10=_bullet_template(16, 10, clr_body),
+        BULLET_18_15=_bullet_template(18, 15, clr_body),
+        BULLET_15_10=_bullet_template(15, 10, clr_body),
+        BULLET_18_12=_bullet_template(18, 12, clr_body),
+    )
+
+
+def _bullet_template(size_pt: int, space_before_pt: int, color):
+    """Build an empty <a:p> with the bullet's paragraph properties, to be deep-copied per bullet"""
+    from pptx.oxml import parse_xml
+    from pptx.oxml.ns import nsdecls
+    
+    return parse_xml(
+        f'<a:p {nsdecls("a")}><a:pPr>'
+        f'<a:spcBef><a:spcPts val="{space_before_pt * 100}"/></a:spcBef>'
+        f'<a:defRPr sz="{size_pt * 100}"><a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:defRPr>'
+        f'</a:pPr></a:p>'
+    )
+
 
 class ReportGenerator:
+    # Shared process pool for generate_report_async when no executor is given
+    _pool: Optional[ProcessPoolExecutor] = None
+    
     def __init__(self):
         self.output_folder = settings.OUTPUT_FOLDER
         os.makedirs(self.output_folder, exist_ok=True)
         
-        # Brand colors
-        self.primary_color = colors.HexColor("#2563eb")
-        self.secondary_color = colors.HexColor("#1e40af")
-        self.accent_color = colors.HexColor("#3b82f6")
-        self.dark_color = colors.HexColor("#1f2937")
-        self.light_color = colors.HexColor("#f3f4f6")
+        # PDF styles and the PPTX base deck are built on first use
+        self._pdf_styles_ready = False
+        self._pptx_template_bytes: Optional[bytes] = None
     
     def generate_report(
         self,
@@ -40,178 +142,191 @@ class ReportGenerator:
         job_id: str
     ) -> str:
         """Generate report in the specified format"""
+        content = self.render_report(data, insights, charts, config)
+        output_path = self._output_path(config, job_id)
+        with open(output_path, "wb") as f:
+            f.write(content)
+        return output_path
+    
+    def render_report(
+        self,
+        data: Dict[str, Any],
+        insights: Dict[str, Any],
+        charts: Dict[str, str],
+        config: Dict[str, Any]
+    ) -> bytes:
+        """Render the report in the specified format and return the file contents"""
         report_type = config.get("report_type", "pdf")
+        if charts:
+            charts = self._existing_charts(charts)
         
         if report_type == "pdf":
-            return self._generate_pdf(data, insights, charts, config, job_id)
+            return self._generate_pdf(data, insights, charts, config)
         elif report_type == "pptx":
-            return self._generate_pptx(data, insights, charts, config, job_id)
+            return self._generate_pptx(data, insights, charts, config)
         else:
             raise ValueError(f"Unsupported report type: {report_type}")
     
-    def _generate_pdf(
+    async def generate_report_async(
         self,
         data: Dict[str, Any],
         insights: Dict[str, Any],
         charts: Dict[str, str],
         config: Dict[str, Any],
-        job_id: str
+        job_id: str,
+        executor: Optional[Executor] = None
     ) -> str:
-        """Generate a professional PDF report"""
-        output_path = os.path.join(self.output_folder, f"{job_id}.pdf")
-        
-        doc = SimpleDocTemplate(
-            output_path,
-            pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch
-        )
-        
-        # Styles
-        styles = getSampleStyleSheet()
-        
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=28,
-            textColor=self.primary_color,
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=self.secondary_color,
-            spaceBefore=20,
-            spaceAfter=10
-        )
-        
-        subheading_style = ParagraphStyle(
-            'CustomSubheading',
-            parent=styles['Heading3'],
-            fontSize=12,
-            textColor=self.dark_color,
-            spaceBefore=15,
-            spaceAfter=8
-        )
-        
-        body_style = ParagraphStyle(
-            'CustomBody',
-            parent=styles['Normal'],
-            fontSize=10,
-            textColor=self.dark_color,
-            alignment=TA_JUSTIFY,
-            spaceAfter=8,
-            leading=14
+        """Generate the report in a worker process; several calls can run in parallel via gather"""
+        if executor is None:
+            executor = self._get_pool()
+        
+        # Reports only read metadata, so the DataFrame isn't shipped to the worker
+        data = {"metadata": data.get("metadata", {})}
+        loop = asyncio.get_running_loop()
+        content = await loop.run_in_executor(
+            executor, render_report_in_worker, data, insights, charts, config
         )
         
-        bullet_style = ParagraphStyle(
-            'CustomBullet',
-            parent=styles['Normal'],
-            fontSize=10,
-            textColor=self.dark_color,
-            leftIndent=20,
-            spaceAfter=5,
-            bulletIndent=10
+        # The worker hands back bytes; write them without blocking the event loop
+        output_path = self._output_path(config, job_id)
+        async with aiofiles.open(output_path, "wb") as f:
+            await f.write(content)
+        return output_path
+    
+    @staticmethod
+    def _existing_charts(charts: Dict[str, str]) -> Dict[str, str]:
+        """Drop charts whose file is missing, listing each chart directory once instead of checking every path"""
+        listings: Dict[str, set] = {}
+        existing = {}
+        for chart_name, chart_path in charts.items():
+            directory, filename = os.path.split(chart_path)
+            if directory not in listings:
+                try:
+                    with os.scandir(directory or ".") as entries:
+                        listings[directory] = {entry.name for entry in entries}
+                except OSError:
+                    listings[directory] = set()
+            if filename in listings[directory]:
+                existing[chart_name] = chart_path
+        return existing
+    
+    def _output_path(self, config: Dict[str, Any], job_id: str) -> str:
+        return os.path.join(self.output_folder, f"{job_id}.{config.get('report_type', 'pdf')}")
+    
+    @classmethod
+    def _get_pool(cls) -> ProcessPoolExecutor:
+        # Created on first use; "spawn" keeps reportlab/pptx state out of forked children
+        if cls._pool is None:
+            cls._pool = ProcessPoolExecutor(
+                max_workers=settings.CPU_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return cls._pool
+    
+    def _generate_pdf(
+        self,
+        data: Dict[str, Any],
+        insights: Dict[str, Any],
+        charts: Dict[str, str],
+        config: Dict[str, Any]
+    ) -> bytes:
+        """Generate a professional PDF report"""
+        rl = _pdf_mod()
+        if not self._pdf_styles_ready:
+            self._build_pdf_styles()
+        
+        buffer = io.BytesIO()
+        doc = rl.SimpleDocTemplate(
+            buffer,
+            pagesize=rl.letter,
+            rightMargin=0.75*rl.inch,
+            leftMargin=0.75*rl.inch,
+            topMargin=0.75*rl.inch,
+            bottomMargin=0.75*rl.inch
         )
         
         # Build document content
         story = []
         
         # Title Page
-        story.append(Spacer(1, 2*inch))
-        story.append(Paragraph(config.get("title", "Performance Report"), title_style))
-        story.append(Spacer(1, 0.3*inch))
-        story.append(Paragraph(config.get("company_name", "Company"), 
-                              ParagraphStyle('Subtitle', parent=styles['Normal'], 
-                                           fontSize=14, textColor=self.accent_color, 
-                                           alignment=TA_CENTER)))
-        story.append(Spacer(1, 0.5*inch))
-        story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", 
-                              ParagraphStyle('Date', parent=styles['Normal'], 
-                                           fontSize=11, alignment=TA_CENTER)))
-        story.append(PageBreak())
+        story.append(rl.Spacer(1, 2*rl.inch))
+        story.append(rl.Paragraph(config.get("title", "Performance Report"), self.title_style))
+        story.append(rl.Spacer(1, 0.3*rl.inch))
+        story.append(rl.Paragraph(config.get("company_name", "Company"), self.subtitle_style))
+        story.append(rl.Spacer(1, 0.5*rl.inch))
+        story.append(rl.Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", self.date_style))
+        story.append(rl.PageBreak())
         
         # Executive Summary
         if config.get("include_summary", True) and insights.get("executive_summary"):
-            story.append(Paragraph("Executive Summary", heading_style))
-            story.append(Paragraph(insights["executive_summary"], body_style))
-            story.append(Spacer(1, 0.3*inch))
+            story.append(rl.Paragraph("Executive Summary", self.heading_style))
+            story.append(rl.Paragraph(insights["executive_summary"], self.body_style))
+            story.append(rl.Spacer(1, 0.3*rl.inch))
         
         # Key Findings
         if insights.get("key_findings"):
-            story.append(Paragraph("Key Findings", heading_style))
-            for finding in insights["key_findings"]:
-                story.append(Paragraph(f"• {finding}", bullet_style))
-            story.append(Spacer(1, 0.3*inch))
+            story.append(rl.Paragraph("Key Findings", self.heading_style))
+            story.append(self._bullet_block(insights["key_findings"]))
+            story.append(rl.Spacer(1, 0.3*rl.inch))
         
         # Performance Highlights
         if insights.get("performance_highlights"):
-            story.append(Paragraph("Performance Highlights", heading_style))
+            story.append(rl.Paragraph("Performance Highlights", self.heading_style))
             
             highlights = insights["performance_highlights"]
             if highlights.get("top_performers"):
-                story.append(Paragraph("Top Performers", subheading_style))
-                for item in highlights["top_performers"]:
-                    story.append(Paragraph(f"✓ {item}", bullet_style))
+                story.append(rl.Paragraph("Top Performers", self.subheading_style))
+                story.append(self._bullet_block(highlights["top_performers"], prefix="✓ "))
             
             if highlights.get("areas_of_concern"):
-                story.append(Paragraph("Areas of Concern", subheading_style))
-                for item in highlights["areas_of_concern"]:
-                    story.append(Paragraph(f"⚠ {item}", bullet_style))
+                story.append(rl.Paragraph("Areas of Concern", self.subheading_style))
+                story.append(self._bullet_block(highlights["areas_of_concern"], prefix="⚠ "))
             
-            story.append(Spacer(1, 0.3*inch))
+            story.append(rl.Spacer(1, 0.3*rl.inch))
         
         # Charts Section
         if config.get("include_charts", True) and charts:
-            story.append(Paragraph("Visual Analytics", heading_style))
+            story.append(rl.Paragraph("Visual Analytics", self.heading_style))
             
             for chart_name, chart_path in charts.items():
-                if os.path.exists(chart_path):
-                    try:
-                        story.append(Spacer(1, 0.2*inch))
-                        story.append(Paragraph(chart_name.replace("_", " ").title(), subheading_style))
-                        img = Image(chart_path, width=6*inch, height=4*inch)
-                        story.append(img)
-                        story.append(Spacer(1, 0.2*inch))
-                    except Exception as e:
-                        print(f"Error adding chart {chart_name}: {e}")
+                try:
+                    story.append(rl.Spacer(1, 0.2*rl.inch))
+                    story.append(rl.Paragraph(chart_name.replace("_", " ").title(), self.subheading_style))
+                    img = rl.Image(self._image_stream(chart_path), width=6*rl.inch, height=4*rl.inch)
+                    story.append(img)
+                    story.append(rl.Spacer(1, 0.2*rl.inch))
+                except Exception as e:
+                    logger.error("Error adding chart %s: %s", chart_name, e)
         
         # Trends
         if insights.get("trends"):
-            story.append(PageBreak())
-            story.append(Paragraph("Trends & Patterns", heading_style))
-            for trend in insights["trends"]:
-                story.append(Paragraph(f"📈 {trend}", bullet_style))
-            story.append(Spacer(1, 0.3*inch))
+            story.append(rl.PageBreak())
+            story.append(rl.Paragraph("Trends & Patterns", self.heading_style))
+            story.append(self._bullet_block(insights["trends"], prefix="📈 "))
+            story.append(rl.Spacer(1, 0.3*rl.inch))
         
         # Recommendations
         if config.get("include_recommendations", True) and insights.get("recommendations"):
-            story.append(Paragraph("Strategic Recommendations", heading_style))
-            for i, rec in enumerate(insights["recommendations"], 1):
-                story.append(Paragraph(f"{i}. {rec}", bullet_style))
-            story.append(Spacer(1, 0.3*inch))
+            story.append(rl.Paragraph("Strategic Recommendations", self.heading_style))
+            story.append(self._bullet_block(
+                [f"{i}. {rec}" for i, rec in enumerate(insights["recommendations"], 1)], prefix=""
+            ))
+            story.append(rl.Spacer(1, 0.3*rl.inch))
         
         # Risk Factors
         if insights.get("risk_factors"):
-            story.append(Paragraph("Risk Factors", heading_style))
-            for risk in insights["risk_factors"]:
-                story.append(Paragraph(f"⚡ {risk}", bullet_style))
-            story.append(Spacer(1, 0.3*inch))
+            story.append(rl.Paragraph("Risk Factors", self.heading_style))
+            story.append(self._bullet_block(insights["risk_factors"], prefix="⚡ "))
+            story.append(rl.Spacer(1, 0.3*rl.inch))
         
         # Opportunities
         if insights.get("opportunities"):
-            story.append(Paragraph("Growth Opportunities", heading_style))
-            for opp in insights["opportunities"]:
-                story.append(Paragraph(f"💡 {opp}", bullet_style))
+            story.append(rl.Paragraph("Growth Opportunities", self.heading_style))
+            story.append(self._bullet_block(insights["opportunities"], prefix="💡 "))
         
         # Data Summary Table
-        story.append(PageBreak())
-        story.append(Paragraph("Data Summary", heading_style))
+        story.append(rl.PageBreak())
+        story.append(rl.Paragraph("Data Summary", self.heading_style))
         
         metadata = data.get("metadata", {})
         total_rows = metadata.get('total_rows', 0)
@@ -225,10 +340,107 @@ class ReportGenerator:
         if metadata.get("date_range"):
             summary_data.append(["Date Range", f"{metadata['date_range']['start']} to {metadata['date_range']['end']}"])
         
-        table = Table(summary_data, colWidths=[2.5*inch, 4*inch])
-        table.setStyle(TableStyle([
+        table = rl.Table(summary_data, colWidths=[2.5*rl.inch, 4*rl.inch])
+        table.setStyle(self.table_style)
+        story.append(table)
+        
+        # Footer
+        story.append(rl.Spacer(1, 1*rl.inch))
+        story.append(rl.Paragraph(
+            f"Report generated by Automated Insight Engine | {insights.get('generated_by', 'AI Analysis')}",
+            self.footer_style
+        ))
+        
+        # Build PDF
+        doc.build(story)
+        return buffer.getvalue()
+    
+    def _build_pdf_styles(self) -> None:
+        """Paragraph and table styles are the same for every report; build them once"""
+        rl = _pdf_mod()
+        
+        # Brand colors
+        self.primary_color = rl.colors.HexColor("#2563eb")
+        self.secondary_color = rl.colors.HexColor("#1e40af")
+        self.accent_color = rl.colors.HexColor("#3b82f6")
+        self.dark_color = rl.colors.HexColor("#1f2937")
+        self.light_color = rl.colors.HexColor("#f3f4f6")
+        
+        styles = rl.getSampleStyleSheet()
+        
+        self.title_style = rl.ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=28,
+            textColor=self.primary_color,
+            spaceAfter=30,
+            alignment=rl.TA_CENTER
+        )
+        
+        self.heading_style = rl.ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=16,
+            textColor=self.secondary_color,
+            spaceBefore=20,
+            spaceAfter=10
+        )
+        
+        self.subheading_style = rl.ParagraphStyle(
+            'CustomSubheading',
+            parent=styles['Heading3'],
+            fontSize=12,
+            textColor=self.dark_color,
+            spaceBefore=15,
+            spaceAfter=8
+        )
+        
+        self.body_style = rl.ParagraphStyle(
+            'CustomBody',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor=self.dark_color,
+            alignment=rl.TA_LEFT,
+            spaceAfter=8,
+            leading=14
+        )
+        
+        self.bullet_style = rl.ParagraphStyle(
+            'CustomBullet',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor=self.dark_color,
+            leftIndent=20,
+            spaceAfter=5,
+            bulletIndent=10
+        )
+        
+        self.subtitle_style = rl.ParagraphStyle(
+            'Subtitle',
+            parent=styles['Normal'],
+            fontSize=14,
+            textColor=self.accent_color,
+            alignment=rl.TA_CENTER
+        )
+        
+        self.date_style = rl.ParagraphStyle(
+            'Date',
+            parent=styles['Normal'],
+            fontSize=11,
+            alignment=rl.TA_CENTER
+        )
+        
+        self.footer_style = rl.ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=8,
+            textColor=rl.colors.gray,
+            alignment=rl.TA_CENTER
+        )
+        
+        self.table_style = rl.TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), self.primary_color),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('TEXTCOLOR', (0, 0), (-1, 0), rl.colors.white),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
             ('FONTSIZE', (0, 0), (-1, 0), 11),
@@ -236,210 +448,224 @@ class ReportGenerator:
             ('BACKGROUND', (0, 1), (-1, -1), self.light_color),
             ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
             ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.white),
+            ('GRID', (0, 0), (-1, -1), 1, rl.colors.white),
             ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
             ('TOPPADDING', (0, 1), (-1, -1), 8),
             ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ]))
-        story.append(table)
-        
-        # Footer
-        story.append(Spacer(1, 1*inch))
-        story.append(Paragraph(
-            f"Report generated by Automated Insight Engine | {insights.get('generated_by', 'AI Analysis')}",
-            ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, 
-                          textColor=colors.gray, alignment=TA_CENTER)
-        ))
+        ])
         
-        # Build PDF
-        doc.build(story)
-        return output_path
+        self._pdf_styles_ready = True
+    
+    def _bullet_block(self, items: List[Any], prefix: str = "• "):
+        """Render a list as one Paragraph with <br/> line breaks instead of one Paragraph per item"""
+        return _pdf_mod().Paragraph(
+            "<br/>".join(f"{prefix}{escape(str(item))}" for item in items),
+            self.bullet_style
+        )
     
     def _generate_pptx(
         self,
         data: Dict[str, Any],
         insights: Dict[str, Any],
         charts: Dict[str, str],
-        config: Dict[str, Any],
-        job_id: str
-    ) -> str:
+        config: Dict[str, Any]
+    ) -> bytes:
         """Generate a professional PowerPoint presentation"""
-        output_path = os.path.join(self.output_folder, f"{job_id}.pptx")
+        pp = _pptx_mod()
+        if self._pptx_template_bytes is None:
+            self._pptx_template_bytes = self._build_template()
         
-        prs = Presentation()
-        prs.slide_width = Inches(13.333)
-        prs.slide_height = Inches(7.5)
+        prs = pp.Presentation(io.BytesIO(self._pptx_template_bytes))
         
         # Slide 1: Title Slide
         slide_layout = prs.slide_layouts[6]  # Blank layout
         slide = prs.slides.add_slide(slide_layout)
         
         # Add title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.5), Inches(12.333), Inches(1.5))
+        title_box = slide.shapes.add_textbox(pp.INCH_05, pp.INCH_25, pp.INCH_12333, pp.INCH_15)
         title_frame = title_box.text_frame
         title_para = title_frame.paragraphs[0]
         title_para.text = config.get("title", "Performance Report")
-        title_para.font.size = Pt(44)
+        title_para.font.size = pp.PT_44
         title_para.font.bold = True
-        title_para.font.color.rgb = RgbColor(37, 99, 235)
-        title_para.alignment = PP_ALIGN.CENTER
+        title_para.font.color.rgb = pp.CLR_TITLE
+        title_para.alignment = pp.PP_ALIGN.CENTER
         
         # Add company name
-        subtitle_box = slide.shapes.add_textbox(Inches(0.5), Inches(4), Inches(12.333), Inches(0.75))
+        subtitle_box = slide.shapes.add_textbox(pp.INCH_05, pp.INCH_4, pp.INCH_12333, pp.INCH_075)
         subtitle_frame = subtitle_box.text_frame
         subtitle_para = subtitle_frame.paragraphs[0]
         subtitle_para.text = config.get("company_name", "Company")
-        subtitle_para.font.size = Pt(24)
-        subtitle_para.font.color.rgb = RgbColor(59, 130, 246)
-        subtitle_para.alignment = PP_ALIGN.CENTER
+        subtitle_para.font.size = pp.PT_24
+        subtitle_para.font.color.rgb = pp.CLR_ACCENT
+        subtitle_para.alignment = pp.PP_ALIGN.CENTER
         
         # Add date
-        date_box = slide.shapes.add_textbox(Inches(0.5), Inches(5), Inches(12.333), Inches(0.5))
+        date_box = slide.shapes.add_textbox(pp.INCH_05, pp.INCH_5, pp.INCH_12333, pp.INCH_05)
         date_frame = date_box.text_frame
         date_para = date_frame.paragraphs[0]
         date_para.text = datetime.now().strftime('%B %d, %Y')
-        date_para.font.size = Pt(16)
-        date_para.font.color.rgb = RgbColor(107, 114, 128)
-        date_para.alignment = PP_ALIGN.CENTER
+        date_para.font.size = pp.PT_16
+        date_para.font.color.rgb = pp.CLR_GRAY
+        date_para.alignment = pp.PP_ALIGN.CENTER
         
         # Slide 2: Executive Summary
         if config.get("include_summary", True) and insights.get("executive_summary"):
             slide = prs.slides.add_slide(prs.slide_layouts[6])
             self._add_slide_title(slide, "Executive Summary")
             
-            content_box = slide.shapes.add_textbox(Inches(0.75), Inches(1.5), Inches(11.833), Inches(5.5))
+            content_box = slide.shapes.add_textbox(pp.INCH_075, pp.INCH_15, pp.INCH_11833, pp.INCH_55)
             tf = content_box.text_frame
             tf.word_wrap = True
             
             para = tf.paragraphs[0]
             para.text = insights["executive_summary"]
-            para.font.size = Pt(16)
-            para.font.color.rgb = RgbColor(31, 41, 55)
-            para.alignment = PP_ALIGN.LEFT
+            para.font.size = pp.PT_16
+            para.font.color.rgb = pp.CLR_BODY
+            para.alignment = pp.PP_ALIGN.LEFT
         
         # Slide 3: Key Findings
         if insights.get("key_findings"):
             slide = prs.slides.add_slide(prs.slide_layouts[6])
             self._add_slide_title(slide, "Key Findings")
             
-            content_box = slide.shapes.add_textbox(Inches(0.75), Inches(1.5), Inches(11.833), Inches(5.5))
+            content_box = slide.shapes.add_textbox(pp.INCH_075, pp.INCH_15, pp.INCH_11833, pp.INCH_55)
             tf = content_box.text_frame
             tf.word_wrap = True
             
-            for i, finding in enumerate(insights["key_findings"][:7]):
-                if i == 0:
-                    para = tf.paragraphs[0]
-                else:
-                    para = tf.add_paragraph()
-                para.text = f"• {finding}"
-                para.font.size = Pt(16)
-                para.font.color.rgb = RgbColor(31, 41, 55)
-                para.space_before = Pt(10)
+            self._add_bullets(tf, [f"• {finding}" for finding in insights["key_findings"][:7]], pp.BULLET_16_10)
         
         # Slide 4-N: Charts
         if config.get("include_charts", True) and charts:
             for chart_name, chart_path in charts.items():
-                if os.path.exists(chart_path):
-                    try:
-                        slide = prs.slides.add_slide(prs.slide_layouts[6])
-                        self._add_slide_title(slide, chart_name.replace("_", " ").title())
-                        
-                        # Add chart image
-                        slide.shapes.add_picture(
-                            chart_path,
-                            Inches(1.5), Inches(1.75),
-                            width=Inches(10.333), height=Inches(5.25)
-                        )
-                    except Exception as e:
-                        print(f"Error adding chart slide {chart_name}: {e}")
+                try:
+                    slide = prs.slides.add_slide(prs.slide_layouts[6])
+                    self._add_slide_title(slide, chart_name.replace("_", " ").title())
+                    
+                    # Add chart image
+                    slide.shapes.add_picture(
+                        self._image_stream(chart_path),
+                        pp.INCH_15, pp.INCH_175,
+                        width=pp.INCH_10333, height=pp.INCH_525
+                    )
+                except Exception as e:
+                    logger.error("Error adding chart slide %s: %s", chart_name, e)
         
         # Slide: Trends
         if insights.get("trends"):
             slide = prs.slides.add_slide(prs.slide_layouts[6])
             self._add_slide_title(slide, "Trends & Patterns")
             
-            content_box = slide.shapes.add_textbox(Inches(0.75), Inches(1.5), Inches(11.833), Inches(5.5))
+            content_box = slide.shapes.add_textbox(pp.INCH_075, pp.INCH_15, pp.INCH_11833, pp.INCH_55)
             tf = content_box.text_frame
             tf.word_wrap = True
             
-            for i, trend in enumerate(insights["trends"]):
-                if i == 0:
-                    para = tf.paragraphs[0]
-                else:
-                    para = tf.add_paragraph()
-                para.text = f"📈 {trend}"
-                para.font.size = Pt(18)
-                para.font.color.rgb = RgbColor(31, 41, 55)
-                para.space_before = Pt(15)
+            self._add_bullets(tf, [f"📈 {trend}" for trend in insights["trends"]], pp.BULLET_18_15)
         
         # Slide: Recommendations
         if config.get("include_recommendations", True) and insights.get("recommendations"):
             slide = prs.slides.add_slide(prs.slide_layouts[6])
             self._add_slide_title(slide, "Strategic Recommendations")
             
-            content_box = slide.shapes.add_textbox(Inches(0.75), Inches(1.5), Inches(11.833), Inches(5.5))
+            content_box = slide.shapes.add_textbox(pp.INCH_075, pp.INCH_15, pp.INCH_11833, pp.INCH_55)
             tf = content_box.text_frame
             tf.word_wrap = True
             
-            for i, rec in enumerate(insights["recommendations"][:7]):
-                if i == 0:
-                    para = tf.paragraphs[0]
-                else:
-                    para = tf.add_paragraph()
-                para.text = f"{i+1}. {rec}"
-                para.font.size = Pt(15)
-                para.font.color.rgb = RgbColor(31, 41, 55)
-                para.space_before = Pt(10)
+            self._add_bullets(
+                tf, [f"{i+1}. {rec}" for i, rec in enumerate(insights["recommendations"][:7])], pp.BULLET_15_10
+            )
         
         # Slide: Opportunities
         if insights.get("opportunities"):
             slide = prs.slides.add_slide(prs.slide_layouts[6])
             self._add_slide_title(slide, "Growth Opportunities")
             
-            content_box = slide.shapes.add_textbox(Inches(0.75), Inches(1.5), Inches(11.833), Inches(5.5))
+            content_box = slide.shapes.add_textbox(pp.INCH_075, pp.INCH_15, pp.INCH_11833, pp.INCH_55)
             tf = content_box.text_frame
             tf.word_wrap = True
             
-            for i, opp in enumerate(insights["opportunities"]):
-                if i == 0:
-                    para = tf.paragraphs[0]
-                else:
-                    para = tf.add_paragraph()
-                para.text = f"💡 {opp}"
-                para.font.size = Pt(18)
-                para.font.color.rgb = RgbColor(31, 41, 55)
-                para.space_before = Pt(12)
+            self._add_bullets(tf, [f"💡 {opp}" for opp in insights["opportunities"]], pp.BULLET_18_12)
         
         # Final Slide: Thank You
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         
-        thank_box = slide.shapes.add_textbox(Inches(0.5), Inches(3), Inches(12.333), Inches(1))
+        thank_box = slide.shapes.add_textbox(pp.INCH_05, pp.INCH_3, pp.INCH_12333, pp.INCH_1)
         tf = thank_box.text_frame
         para = tf.paragraphs[0]
         para.text = "Thank You"
-        para.font.size = Pt(44)
+        para.font.size = pp.PT_44
         para.font.bold = True
-        para.font.color.rgb = RgbColor(37, 99, 235)
-        para.alignment = PP_ALIGN.CENTER
+        para.font.color.rgb = pp.CLR_TITLE
+        para.alignment = pp.PP_ALIGN.CENTER
         
-        footer_box = slide.shapes.add_textbox(Inches(0.5), Inches(4.5), Inches(12.333), Inches(0.5))
+        footer_box = slide.shapes.add_textbox(pp.INCH_05, pp.INCH_45, pp.INCH_12333, pp.INCH_05)
         tf = footer_box.text_frame
         para = tf.paragraphs[0]
         para.text = f"Powered by Automated Insight Engine | {insights.get('generated_by', 'AI Analysis')}"
-        para.font.size = Pt(14)
-        para.font.color.rgb = RgbColor(107, 114, 128)
-        para.alignment = PP_ALIGN.CENTER
+        para.font.size = pp.PT_14
+        para.font.color.rgb = pp.CLR_GRAY
+        para.alignment = pp.PP_ALIGN.CENTER
         
         # Save presentation
-        prs.save(output_path)
-        return output_path
+        buffer = io.BytesIO()
+        prs.save(buffer)
+        return buffer.getvalue()
+    
+    @staticmethod
+    def _add_bullets(tf, lines: List[str], template) -> None:
+        """Replace the text frame's paragraphs with one copy of `template` per line"""
+        if not lines:
+            return
+        
+        txBody = tf._txBody
+        for p in txBody.p_lst:
+            txBody.remove(p)
+        for line in lines:
+            p = deepcopy(template)
+            # Same as python-pptx's paragraph.text: line breaks become <a:br/>, control characters are escaped
+            p.append_text(line)
+            txBody.append(p)
+    
+    @staticmethod
+    def _build_template() -> bytes:
+        """Serialize an empty 16:9 presentation to use as the base for each deck"""
+        pp = _pptx_mod()
+        prs = pp.Presentation()
+        prs.slide_width = pp.INCH_13333
+        prs.slide_height = pp.INCH_75
+        buffer = io.BytesIO()
+        prs.save(buffer)
+        return buffer.getvalue()
+    
+    def _image_stream(self, path: str) -> io.BytesIO:
+        """Read a chart image into memory in one call and return it as a stream"""
+        with open(path, "rb") as f:
+            return io.BytesIO(f.read())
     
     def _add_slide_title(self, slide, title_text: str):
         """Add a consistent title to a slide"""
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.4), Inches(12.333), Inches(0.8))
+        pp = _pptx_mod()
+        title_box = slide.shapes.add_textbox(pp.INCH_05, pp.INCH_04, pp.INCH_12333, pp.INCH_08)
         tf = title_box.text_frame
         para = tf.paragraphs[0]
         para.text = title_text
-        para.font.size = Pt(32)
+        para.font.size = pp.PT_32
         para.font.bold = True
-        para.font.color.rgb = RgbColor(37, 99, 235)
+        para.font.color.rgb = pp.CLR_TITLE
+
+
+# One ReportGenerator per worker process, created on first use
+_worker_generator = None
+
+
+def render_report_in_worker(
+    data: Dict[str, Any],
+    insights: Dict[str, Any],
+    charts: Dict[str, str],
+    config: Dict[str, Any]
+) -> bytes:
+    """Process-pool entry point for render_report"""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = ReportGenerator()
+    return _worker_generator.render_report(data, insights, charts, config)
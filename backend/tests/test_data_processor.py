@@ -0,0 +1,24 @@
+from services.data_processor import DataProcessor
+
+
+def test_csv_duplicate_headers_are_deduplicated(tmp_path):
+    path = tmp_path / "dupes.csv"
+    path.write_text("a,a,b\n1,2,x\n3,4,y\n")
+
+    processor = DataProcessor()
+    result = processor.process_files([str(path)])
+    metadata = result["metadata"]
+
+    assert metadata["columns"] == ["a", "a.1", "b"]
+    assert metadata["numeric_columns"] == ["a", "a.1"]
+    assert metadata["column_stats"]["a"]["mean"] == 2.0
+    assert metadata["column_stats"]["a.1"]["mean"] == 3.0
+
+
+def test_csv_non_utf8_is_rejected_like_pandas(tmp_path):
+    path = tmp_path / "latin1.csv"
+    path.write_bytes("name,value\ncaf\xe9,1\n".encode("latin-1"))
+
+    processor = DataProcessor()
+
+    assert processor.get_preview(str(path)) == {"error": "Could not load file"}
@@ -0,0 +1,37 @@
+import asyncio
+
+from services import insight_generator as ig
+
+
+class _Response:
+    def __init__(self, text):
+        self.text = text
+
+
+class _RaisingBatchModel:
+    """Fails any coalesced request, answers single requests with their own summary"""
+
+    def __init__(self):
+        self.batched_calls = 0
+
+    async def generate_content_async(self, prompt, generation_config=None):
+        if "### REQUEST" in prompt:
+            self.batched_calls += 1
+            raise RuntimeError("quota exceeded")
+        return _Response("answer: " + prompt.rstrip().splitlines()[-1])
+
+
+def test_failed_batch_retries_each_request(monkeypatch):
+    monkeypatch.setattr(ig, "GEMINI_KEY", "test-key")
+    generator = ig.InsightGenerator()
+    generator.gemini_available = True
+    model = _RaisingBatchModel()
+    generator._model_obj = model
+
+    items = [{"metadata": {"total_rows": i, "columns": [f"col{i}"]}} for i in range(3)]
+    results = asyncio.run(generator.generate_insights_batch(items))
+
+    assert model.batched_calls == 1
+    assert [r["source"] for r in results] == ["gemini"] * 3
+    for i, result in enumerate(results):
+        assert result["text"] == f"answer: - Column names (sample): col{i}"
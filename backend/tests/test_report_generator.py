@@ -0,0 +1,19 @@
+import io
+
+from pptx import Presentation
+
+from services.report_generator import ReportGenerator
+
+
+def test_pptx_bullets_handle_line_breaks_and_control_characters(tmp_path, monkeypatch):
+    monkeypatch.setattr("config.settings.OUTPUT_FOLDER", str(tmp_path))
+    insights = {"key_findings": ["first\nsecond", "bell\x07 inside", "plain"]}
+
+    content = ReportGenerator().render_report(
+        {"metadata": {}}, insights, {}, {"report_type": "pptx", "include_charts": False}
+    )
+
+    slide = Presentation(io.BytesIO(content)).slides[1]
+    paragraphs = slide.shapes[1].text_frame.paragraphs
+    assert [p.text for p in paragraphs] == ["• first\x0bsecond", "• bell_x0007_ inside", "• plain"]
+    assert paragraphs[0].font.size.pt == 16